@@ -1,12 +1,37 @@
+from typing import Annotated
+
 import typer
-from rich import print
 
+from . import __version__
 from .main import add
 
 app = typer.Typer()
 
 
+def version_callback(value: bool) -> None:
+    """Print the version and exit, before any command code runs."""
+    if value:
+        typer.echo(f"cookie-taster {__version__}")
+        raise typer.Exit()
+
+
 @app.command()
-def main(n1: int, n2: int) -> None:
+def main(
+    n1: int,
+    n2: int,
+    version: Annotated[
+        bool | None,
+        typer.Option(
+            "--version",
+            "-v",
+            callback=version_callback,
+            is_eager=True,
+            help="Show the version and exit.",
+        ),
+    ] = None,
+) -> None:
     """Add the arguments and print the result."""
+    # Deferred so that `--version` doesn't load Rich (Typer still loads it for `--help`)
+    from rich import print
+
     print(add(n1, n2))
@@ -1,5 +1,6 @@
 from typer.testing import CliRunner
 
+from cookie_taster import __version__
 from cookie_taster.cli import app
 
 runner = CliRunner()
@@ -10,3 +11,17 @@ def test_help():
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
     assert "Add the arguments and print the result" in result.stdout
+
+
+def test_add():
+    """The command prints the sum of its arguments."""
+    result = runner.invoke(app, ["1", "2"])
+    assert result.exit_code == 0
+    assert result.stdout.strip() == "3"
+
+
+def test_version():
+    """The version option prints the version without running the command."""
+    result = runner.invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert result.stdout.strip() == f"cookie-taster {__version__}"